@@ -12,6 +12,9 @@ from ellipse import filled_ellipse
 
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
+IDLE_FPS = 15
+IDLE_MODE = os.environ.get("BALLOON_IDLE_MODE", "1") != "0"
+CPU_STATS = os.environ.get("BALLOON_CPU_STATS") == "1"
 
 COLOR_WHITE = (255, 255, 255)
 COLOR_BLACK = (0, 0, 0)
@@ -83,6 +86,8 @@ class Cloud:
         self.speed: float = 0.0
         self.rx: int = 0
         self.ry: int = 0
+        self.sprite: Any = None
+        self.origin: tuple = (0, 0)
         self.reset()
         self.x = float(random.randint(0, WIDTH))
 
@@ -92,15 +97,31 @@ class Cloud:
         self.speed = random.uniform(0.5, 1.5)
         self.rx = random.randint(40, 80)
         self.ry = int(self.rx * 0.6)
-
-    def update(self):
-        self.x -= self.speed
+        self.sprite, self.origin = self.rasterize()
+
+    def rasterize(self) -> tuple:
+        # Shape only changes on reset, so scan-convert once and blit every frame
+        dx, dy = int(self.rx*0.4), int(self.ry*0.2)
+        rx2, ry2 = int(self.rx*0.7), int(self.ry*0.8)
+        ox, oy = self.rx + 1, self.ry + 1
+        sprite = pygame.Surface((self.rx + dx + rx2 + 3, self.ry*2 + 3))
+        sprite.fill(COLOR_SKY_LIGHT)
+        sprite.set_colorkey(COLOR_SKY_LIGHT)
+        filled_ellipse(sprite, ox, oy, self.rx, self.ry, (100, 120, 160))
+        filled_ellipse(sprite, ox + dx, oy - dy, rx2, ry2, (100, 120, 160))
+        return sprite, (ox, oy)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.sprite.get_rect(topleft=(int(self.x) - self.origin[0], int(self.y) - self.origin[1]))
+
+    def update(self, steps: int = 1):
+        self.x -= self.speed * steps
         if self.x < -self.rx * 2:
             self.reset()
 
     def draw(self, screen):
-        filled_ellipse(screen, int(self.x), int(self.y), self.rx, self.ry, (100, 120, 160))
-        filled_ellipse(screen, int(self.x + self.rx*0.4), int(self.y - self.ry*0.2), int(self.rx*0.7), int(self.ry*0.8), (100, 120, 160))
+        screen.blit(self.sprite, self.rect)
 
 class Particle:
     def __init__(self, x: float, y: float, color: tuple):
@@ -310,18 +331,70 @@ def save_high_score(duration: int, score: int) -> bool:
         json.dump(scores_dict, f)
     return score >= history[0]
 
-def draw_text_outlined(screen, text: str, font, color, pos, outline_color=COLOR_BLACK):
+def outlined_text_blits(text: str, font, color, pos, outline_color=COLOR_BLACK) -> List[tuple]:
     surf = font.render(text, True, color)
+    outline_surf = font.render(text, True, outline_color)
     ox, oy = pos
-    for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]:
-        outline_surf = font.render(text, True, outline_color)
-        screen.blit(outline_surf, (ox + dx, oy + dy))
-    screen.blit(surf, (ox, oy))
+    blits = [(outline_surf, (ox + dx, oy + dy)) for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]]
+    blits.append((surf, (ox, oy)))
+    return blits
 
-def draw_text_centered(screen, text: str, font, color, y, outline_color=COLOR_BLACK):
-    surf = font.render(text, True, color)
-    x = (WIDTH - surf.get_width()) // 2
-    draw_text_outlined(screen, text, font, color, (x, y), outline_color)
+def centered_text_blits(text: str, font, color, y, outline_color=COLOR_BLACK) -> List[tuple]:
+    x = (WIDTH - font.size(text)[0]) // 2
+    return outlined_text_blits(text, font, color, (x, y), outline_color)
+
+def draw_text_outlined(screen, text: str, font, color, pos, outline_color=COLOR_BLACK):
+    screen.blits(outlined_text_blits(text, font, color, pos, outline_color), doreturn=False)
+
+def idle_screen_blits(state: GameState, fonts: tuple, difficulty: Difficulty, selected_dur_idx: int,
+                      high_scores: Dict[str, List[int]], session: Any) -> List[tuple]:
+    """
+    Renders the static text of the menu and game-over screens once, so idle frames
+    only have to blit the cached surfaces over the drifting clouds.
+    """
+    font_large, font_medium, font_small = fonts
+    blits: List[tuple] = []
+    if state == GameState.DIFFICULTY_SELECT:
+        blits += centered_text_blits("CHOOSE SKILL LEVEL", font_large, COLOR_WHITE, 150)
+        for i, d in enumerate([Difficulty.EASY, Difficulty.NORMAL, Difficulty.HARD]):
+            blits += centered_text_blits(f"{i+1}: {d.label}", font_medium, d.color, 300 + i*60)
+    elif state == GameState.MENU:
+        blits += centered_text_blits("2D BALLOON POPPING GAME ", font_large, COLOR_YELLOW, 100)
+        blits += centered_text_blits(f"Difficulty: {difficulty.label}", font_small, difficulty.color, 200)
+        for i, d in enumerate(DURATIONS):
+            color = COLOR_ORANGE if i == selected_dur_idx else COLOR_WHITE
+            text = f"> {d}s Mode <" if i == selected_dur_idx else f"{d}s Mode"
+            blits += centered_text_blits(text, font_medium, color, 280 + i * 50)
+        hs_list = high_scores.get(str(DURATIONS[selected_dur_idx]), [0])
+        blits += centered_text_blits("TOP RECORDS:", font_small, COLOR_GREEN, 480)
+        for i, h in enumerate(hs_list): blits += centered_text_blits(f"{i+1}. {h}", font_small, COLOR_WHITE, 510 + i * 30)
+        blits += centered_text_blits("SPACE to Enter Session | BACKSPACE for Difficulty", font_small, COLOR_WHITE, 650)
+    elif state == GameState.GAME_OVER and session:
+        s = cast(GameSession, session)
+        blits += centered_text_blits("GAME OVER", font_large, COLOR_RED, 100)
+        blits += centered_text_blits(f"Point Total: {s.score}", font_medium, COLOR_WHITE, 200)
+        acc = (s.stat_hit / s.stat_fired * 100) if s.stat_fired > 0 else 0
+        blits += centered_text_blits(f"Accuracy: {acc:.1f}%", font_small, COLOR_CYAN, 280)
+        blits += centered_text_blits(f"Small Pops: {s.stat_small}", font_small, COLOR_RED, 320)
+        blits += centered_text_blits(f"Large Pops: {s.stat_large}", font_small, COLOR_BLUE, 360)
+        hs_list = high_scores.get(str(s.duration), [0])
+        if s.score < hs_list[0]:
+            blits += centered_text_blits(f"Best Score: {hs_list[0]}", font_medium, COLOR_GREEN, 420)
+        blits += centered_text_blits("SPACE to Replay | ESC for Main Menu", font_small, COLOR_WHITE, 550)
+    return blits
+
+def restore_idle_region(screen, rect: pygame.Rect, clouds: List[Cloud], overlay: pygame.Surface):
+    screen.set_clip(rect)
+    screen.fill(COLOR_SKY_LIGHT, rect)
+    for c in clouds:
+        if c.rect.colliderect(rect): c.draw(screen)
+    screen.blit(overlay, rect, area=rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+    screen.set_clip(None)
+
+def wait_for_events(timeout_ms: int) -> List[Any]:
+    event = pygame.event.wait(timeout_ms)
+    if event.type == pygame.NOEVENT: return []
+    return [event] + pygame.event.get()
 
 def draw_wind_indicator(screen, wind_force: float):
     cx, cy = WIDTH - 80, 150
@@ -342,6 +415,7 @@ def main():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("2D Balloon Popping Game")
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
     clock = pygame.time.Clock()
     font_large = pygame.font.SysFont("Arial", 64, bold=True)
     font_medium = pygame.font.SysFont("Arial", 32, bold=True)
@@ -363,11 +437,27 @@ def main():
     session: Any = None
     needle_angle: float = 45.0
     needle_dir: int = 1
+    idle_key: Any = None
+    idle_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    needs_flip = False
+    next_ambient_tick: int = 0
+    cpu_stats: Dict[GameState, List[float]] = {}
+    last_cpu, last_wall = time.process_time(), time.perf_counter()
     running = True
     while running:
-        screen.fill(COLOR_SKY_LIGHT)
-        for event in pygame.event.get():
+        if state == GameState.PLAYING or not IDLE_MODE:
+            events = pygame.event.get()
+        else:
+            # Sleep until input arrives or the next ambient cloud tick is due
+            events = wait_for_events(max(1, next_ambient_tick - pygame.time.get_ticks()))
+        if CPU_STATS:
+            cpu, wall = time.process_time(), time.perf_counter()
+            totals = cpu_stats.setdefault(state, [0.0, 0.0])
+            totals[0] += cpu - last_cpu; totals[1] += wall - last_wall
+            last_cpu, last_wall = cpu, wall
+        for event in events:
             if event.type == pygame.QUIT: running = False
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): needs_flip = True
             if event.type == pygame.KEYDOWN:
                 if state == GameState.DIFFICULTY_SELECT:
                     if event.key == pygame.K_1: difficulty = Difficulty.EASY; state = GameState.MENU
@@ -399,23 +489,55 @@ def main():
                         session = GameSession(DURATIONS[selected_dur_idx], difficulty)
                         state = GameState.PLAYING
                     elif event.key == pygame.K_ESCAPE: state = GameState.MENU
+        if state != GameState.PLAYING:
+            fonts = (font_large, font_medium, font_small)
+            pulse_blits: List[tuple] = []
+            if state == GameState.GAME_OVER and session:
+                s = cast(GameSession, session)
+                if s.score >= high_scores.get(str(s.duration), [0])[0]:
+                    hs_color = (abs(int(math.sin(time.time()*12)*100)) + 155, 255, 155)
+                    pulse_blits = centered_text_blits("NEW HIGH SCORE!", font_medium, hs_color, 420)
+            if not IDLE_MODE:
+                # Original behaviour: re-render the whole screen at full rate
+                screen.fill(COLOR_SKY_LIGHT)
+                for c in clouds: c.update(); c.draw(screen)
+                screen.blits(idle_screen_blits(state, fonts, difficulty, selected_dur_idx, high_scores, session), doreturn=False)
+                screen.blits(pulse_blits, doreturn=False)
+                pygame.display.flip(); clock.tick(FPS)
+                continue
+            now = pygame.time.get_ticks()
+            key = (state, difficulty, selected_dur_idx, high_scores, session)
+            if key != idle_key:
+                idle_key = key
+                idle_overlay.fill((0, 0, 0, 0))
+                idle_overlay.blits(idle_screen_blits(state, fonts, difficulty, selected_dur_idx, high_scores, session), doreturn=False)
+                screen.fill(COLOR_SKY_LIGHT)
+                for c in clouds: c.draw(screen)
+                screen.blit(idle_overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+                screen.blits(pulse_blits, doreturn=False)
+                needs_flip = True
+            if now < next_ambient_tick:
+                if needs_flip: pygame.display.flip(); needs_flip = False
+                continue
+            next_ambient_tick = now + 1000 // IDLE_FPS
+            dirty: List[pygame.Rect] = []
+            for c in clouds:
+                dirty.append(c.rect)
+                c.update(FPS // IDLE_FPS)
+                dirty.append(c.rect)
+            if pulse_blits:
+                dirty.append(pulse_blits[0][0].get_rect(topleft=pulse_blits[-1][1]).inflate(2, 2))
+            dirty = [r.clip(screen.get_rect()) for r in dirty]
+            dirty = [r for r in dirty if r.width and r.height]
+            for r in dirty: restore_idle_region(screen, r, clouds, idle_overlay)
+            screen.blits(pulse_blits, doreturn=False)
+            if needs_flip: pygame.display.flip(); needs_flip = False
+            else: pygame.display.update(dirty)
+            continue
+        idle_key = None
+        screen.fill(COLOR_SKY_LIGHT)
         for c in clouds: c.update(); c.draw(screen)
-        if state == GameState.DIFFICULTY_SELECT:
-            draw_text_centered(screen, "CHOOSE SKILL LEVEL", font_large, COLOR_WHITE, 150)
-            for i, d in enumerate([Difficulty.EASY, Difficulty.NORMAL, Difficulty.HARD]):
-                draw_text_centered(screen, f"{i+1}: {d.label}", font_medium, d.color, 300 + i*60)
-        elif state == GameState.MENU:
-            draw_text_centered(screen, "2D BALLOON POPPING GAME ", font_large, COLOR_YELLOW, 100)
-            draw_text_centered(screen, f"Difficulty: {difficulty.label}", font_small, difficulty.color, 200)
-            for i, d in enumerate(DURATIONS):
-                color = COLOR_ORANGE if i == selected_dur_idx else COLOR_WHITE
-                text = f"> {d}s Mode <" if i == selected_dur_idx else f"{d}s Mode"
-                draw_text_centered(screen, text, font_medium, color, 280 + i * 50)
-            hs_list = high_scores.get(str(DURATIONS[selected_dur_idx]), [0])
-            draw_text_centered(screen, "TOP RECORDS:", font_small, COLOR_GREEN, 480)
-            for i, h in enumerate(hs_list): draw_text_centered(screen, f"{i+1}. {h}", font_small, COLOR_WHITE, 510 + i * 30)
-            draw_text_centered(screen, "SPACE to Enter Session | BACKSPACE for Difficulty", font_small, COLOR_WHITE, 650)
-        elif state == GameState.PLAYING and session:
+        if state == GameState.PLAYING and session:
             s: GameSession = cast(GameSession, session)
             s.frames_count += 1
             now = pygame.time.get_ticks()
@@ -488,21 +610,10 @@ def main():
             draw_text_outlined(screen, f"GRAV: {GRAVITY_BASE*diff_mult:.2f}", font_tiny, COLOR_PURPLE, (WIDTH-220, 85))
             if is_double: draw_text_outlined(screen, "2X POINTS ACTIVE!", font_tiny, COLOR_YELLOW, (WIDTH-220, 110))
             if is_slow: draw_text_outlined(screen, "SLOW-MO ACTIVE!", font_tiny, COLOR_CYAN, (WIDTH-220, 135))
-        elif state == GameState.GAME_OVER and session:
-            s = cast(GameSession, session)
-            draw_text_centered(screen, "GAME OVER", font_large, COLOR_RED, 100)
-            draw_text_centered(screen, f"Point Total: {s.score}", font_medium, COLOR_WHITE, 200)
-            acc = (s.stat_hit / s.stat_fired * 100) if s.stat_fired > 0 else 0
-            draw_text_centered(screen, f"Accuracy: {acc:.1f}%", font_small, COLOR_CYAN, 280)
-            draw_text_centered(screen, f"Small Pops: {s.stat_small}", font_small, COLOR_RED, 320)
-            draw_text_centered(screen, f"Large Pops: {s.stat_large}", font_small, COLOR_BLUE, 360)
-            cur_dur = s.duration; hs_list = high_scores.get(str(cur_dur), [0])
-            is_new = s.score >= hs_list[0]
-            hs_text = "NEW HIGH SCORE!" if is_new else f"Best Score: {hs_list[0]}"
-            hs_color = (abs(int(math.sin(time.time()*12)*100)) + 155, 255, 155) if is_new else COLOR_GREEN
-            draw_text_centered(screen, hs_text, font_medium, hs_color, 420)
-            draw_text_centered(screen, "SPACE to Replay | ESC for Main Menu", font_small, COLOR_WHITE, 550)
         pygame.display.flip(); clock.tick(FPS)
+    if CPU_STATS:
+        for st, (cpu, wall) in cpu_stats.items():
+            print(f"{st.name}: {100 * cpu / max(wall, 1e-9):.1f}% CPU over {wall:.1f}s")
     pygame.quit()
 
 if __name__ == "__main__": main()
\ No newline at end of file